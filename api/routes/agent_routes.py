@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 from models.schemas import AgentInput
 from logic.agent_brain import agent_brain
+from middleware.body_cache import CachedBodyRoute
 
-router = APIRouter(prefix="/agent", tags=["Agent Logic"])
+# CachedBodyRoute lets body validation reuse JSON already parsed by middlewares
+router = APIRouter(prefix="/agent", tags=["Agent Logic"], route_class=CachedBodyRoute)
 
 @router.post("/run")
 def run_agent(data: AgentInput):
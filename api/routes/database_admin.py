@@ -12,6 +12,14 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from logic.category_snapshot import (
+    CategorySnapshot,
+    category_rows_from_memory,
+    current_snapshot,
+    invalidate_snapshot,
+    publish_snapshot,
+)
+
 # Import existing components with fallbacks
 try:
     from utils.logger import logger
@@ -212,98 +220,44 @@ async def get_database_categories(
     offset: int = 0,
     category_type: Optional[str] = None,
     active_only: bool = True,
+    cursor: Optional[str] = None,
 ):
     """
     Get asset categories from database (with memory fallback)
+
+    Pages come from a versioned snapshot with prebuilt per-type and active-only
+    indexes. Pass `cursor` (the previous page's `next_cursor`) for keyset pagination.
     """
     try:
-        if not DatabaseAssetCategoryManager:
-            # Fallback to memory-based categories
-            try:
-                from logic.asset_categories import asset_category_manager
-
-                categories = []
-                for cat_id, cat_data in asset_category_manager.categories.items():
-                    if (
-                        category_type
-                        and hasattr(cat_data, "category_type")
-                        and cat_data.category_type.value != category_type
-                    ):
-                        continue
-
-                    categories.append(
-                        {
-                            "id": cat_id,
-                            "name": cat_data.name,
-                            "category_type": cat_data.category_type.value
-                            if hasattr(cat_data, "category_type")
-                            else "unknown",
-                            "description": cat_data.description,
-                            "source": "memory",
-                        }
-                    )
-
-                # Apply pagination
-                total_count = len(categories)
-                paginated_categories = categories[offset : offset + limit]
-
-                return {
-                    "success": True,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "source": "memory",
-                    "pagination": {
-                        "total": total_count,
-                        "limit": limit,
-                        "offset": offset,
-                        "has_more": offset + limit < total_count,
-                    },
-                    "categories": paginated_categories,
-                }
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=503,
-                    detail=f"Neither database nor memory categories available: {str(e)}",
-                )
-
         logger.info(f"Getting database categories - limit: {limit}, offset: {offset}")
 
-        # Use database manager
-        db_manager = DatabaseAssetCategoryManager()
-
-        # Get all categories
-        all_categories = await db_manager.get_categories()
-
-        # Apply filters
-        filtered_categories = []
-        for cat_id, cat_data in all_categories.items():
-            # Filter by active status
-            if active_only and not cat_data.get("is_active", True):
-                continue
-
-            # Filter by category type
-            if category_type and cat_data.get("category_type") != category_type:
-                continue
-
-            filtered_categories.append({"id": cat_id, **cat_data})
-
-        # Apply pagination
-        total_count = len(filtered_categories)
-        paginated_categories = filtered_categories[offset : offset + limit]
+        snapshot = await _get_category_snapshot()
+        page = snapshot.page(
+            limit=limit,
+            category_type=category_type,
+            active_only=active_only,
+            cursor=cursor,
+            offset=offset,
+        )
 
         return {
             "success": True,
             "timestamp": datetime.utcnow().isoformat(),
-            "source": "database",
+            "source": snapshot.source,
+            "snapshot_version": snapshot.version,
             "pagination": {
-                "total": total_count,
+                "total": page["total"],
                 "limit": limit,
                 "offset": offset,
-                "has_more": offset + limit < total_count,
+                "cursor": cursor,
+                "next_cursor": page["next_cursor"],
+                "has_more": page["has_more"],
             },
-            "categories": paginated_categories,
+            "categories": page["categories"],
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Get categories endpoint failed: {e}")
         raise HTTPException(
@@ -391,6 +345,32 @@ async def database_health_check():
 
 
 # Helper functions
+async def _load_category_rows():
+    """Load raw category rows from the database, or from memory as a fallback"""
+    if DatabaseAssetCategoryManager:
+        db_manager = DatabaseAssetCategoryManager()
+        return "database", await db_manager.get_categories()
+
+    try:
+        from logic.asset_categories import asset_category_manager
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Neither database nor memory categories available: {str(e)}",
+        )
+    return "memory", category_rows_from_memory(asset_category_manager.categories)
+
+
+async def _get_category_snapshot() -> CategorySnapshot:
+    """Return the current category snapshot, building it on first use"""
+    snapshot = current_snapshot()
+    if snapshot is None:
+        source, rows = await _load_category_rows()
+        snapshot = publish_snapshot(rows, source)
+        logger.info(f"Category snapshot v{snapshot.version} built from {source} ({len(snapshot)} rows)")
+    return snapshot
+
+
 async def _post_migration_tasks():
     """Background tasks to run after successful migration"""
     try:
@@ -405,6 +385,10 @@ async def _post_migration_tasks():
             db_manager = DatabaseAssetCategoryManager()
             await db_manager.get_categories(force_refresh=True)
 
+            # Task 3: Rebuild the category snapshot from the migrated data
+            invalidate_snapshot()
+            await _get_category_snapshot()
+
         logger.info("✅ Post-migration tasks completed")
 
     except Exception as e:
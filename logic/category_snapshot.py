@@ -0,0 +1,124 @@
+# logic/category_snapshot.py
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+# Index key: (category_type or None for "any type", active_only)
+IndexKey = Tuple[Optional[str], bool]
+
+
+def category_rows_from_memory(categories: Dict[Any, Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Convert in-memory category objects (logic.asset_categories) into plain row dicts.
+    Done once per snapshot build instead of once per request.
+    """
+    rows = {}
+    for cat_id, cat_data in categories.items():
+        rows[cat_id] = {
+            "name": cat_data.name,
+            "category_type": cat_data.category_type.value
+            if hasattr(cat_data, "category_type")
+            else "unknown",
+            "description": cat_data.description,
+            "source": "memory",
+        }
+    return rows
+
+
+class CategorySnapshot:
+    """
+    Immutable, versioned view of the category catalog.
+
+    Rows are sorted by id and indexed by (category_type, active_only), so a page
+    is a bisect into a prebuilt position list plus a slice of `limit` rows.
+    """
+
+    def __init__(self, rows: Dict[Any, Dict[str, Any]], source: str, version: int):
+        ordered = sorted(rows.items(), key=lambda item: str(item[0]))
+        self.source = source
+        self.version = version
+        self.ids: List[str] = [str(cat_id) for cat_id, _ in ordered]
+        self.rows: List[Dict[str, Any]] = [{"id": cat_id, **data} for cat_id, data in ordered]
+        self._indexes: Dict[IndexKey, List[int]] = self._build_indexes()
+
+    def _build_indexes(self) -> Dict[IndexKey, List[int]]:
+        indexes: Dict[IndexKey, List[int]] = {(None, False): [], (None, True): []}
+        for pos, row in enumerate(self.rows):
+            cat_type = row.get("category_type")
+            active = row.get("is_active", True)
+
+            indexes[(None, False)].append(pos)
+            indexes.setdefault((cat_type, False), []).append(pos)
+            if active:
+                indexes[(None, True)].append(pos)
+                indexes.setdefault((cat_type, True), []).append(pos)
+        return indexes
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def get(self, cat_id: Any) -> Optional[Dict[str, Any]]:
+        key = str(cat_id)
+        pos = bisect_left(self.ids, key)
+        if pos < len(self.ids) and self.ids[pos] == key:
+            return self.rows[pos]
+        return None
+
+    def count(self, category_type: Optional[str] = None, active_only: bool = False) -> int:
+        return len(self._indexes.get((category_type, active_only), ()))
+
+    def page(
+        self,
+        limit: int,
+        category_type: Optional[str] = None,
+        active_only: bool = True,
+        cursor: Optional[str] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Return one page of rows.
+        With `cursor` (the last id of the previous page) this is keyset pagination;
+        otherwise `offset` is used. Both cost O(log n + limit).
+        """
+        index = self._indexes.get((category_type, active_only), [])
+
+        if cursor is not None:
+            start = bisect_left(index, bisect_right(self.ids, str(cursor)))
+        else:
+            start = max(offset, 0)
+
+        end = start + max(limit, 0)
+        positions = index[start:end]
+        has_more = end < len(index)
+
+        return {
+            "categories": [self.rows[pos] for pos in positions],
+            "total": len(index),
+            "has_more": has_more,
+            "next_cursor": self.ids[positions[-1]] if (has_more and positions) else None,
+        }
+
+
+# -----------------------------
+# Process-wide current snapshot
+# -----------------------------
+_current: Optional[CategorySnapshot] = None
+_version = 0
+
+
+def current_snapshot() -> Optional[CategorySnapshot]:
+    return _current
+
+
+def publish_snapshot(rows: Dict[Any, Dict[str, Any]], source: str) -> CategorySnapshot:
+    """Build a new snapshot with the next version number and make it current."""
+    global _current, _version
+    _version += 1
+    _current = CategorySnapshot(rows, source, _version)
+    return _current
+
+
+def invalidate_snapshot() -> None:
+    """Drop the current snapshot; the next reader rebuilds it."""
+    global _current
+    _current = None
@@ -0,0 +1,77 @@
+# middleware/body_cache.py
+
+import json
+from typing import Any, Callable
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+
+# Keys stored directly in the ASGI scope so every Request built on the same
+# scope (middlewares, the route handler) shares one copy.
+BODY_SCOPE_KEY = "mm.body"
+JSON_SCOPE_KEY = "mm.json"
+
+
+async def get_cached_body(request: Request) -> bytes:
+    """
+    Return the raw request body, reading it only once per request.
+
+    The first read goes through request.body(), so Starlette's own body cache
+    is populated too and BaseHTTPMiddleware replays it to the downstream app.
+    A client disconnect raises ClientDisconnect (from request.body()) and
+    nothing is cached.
+    """
+    cached = request.scope.get(BODY_SCOPE_KEY)
+    if cached is not None:
+        return cached
+
+    body = await request.body()
+    request.scope[BODY_SCOPE_KEY] = body
+    return body
+
+
+async def get_cached_json(request: Request) -> Any:
+    """
+    Return the parsed JSON body, parsing it at most once per request.
+    Decode errors are raised to the caller and not cached.
+    """
+    if JSON_SCOPE_KEY in request.scope:
+        return request.scope[JSON_SCOPE_KEY]
+
+    body = await get_cached_body(request)
+    parsed = json.loads(body)
+    request.scope[JSON_SCOPE_KEY] = parsed
+    return parsed
+
+
+class CachedBodyRequest(Request):
+    """
+    Request whose body()/json() go through the scope cache, so FastAPI's
+    body validation reuses whatever a middleware already read and parsed.
+    """
+
+    async def body(self) -> bytes:
+        cached = self.scope.get(BODY_SCOPE_KEY)
+        if cached is not None:
+            return cached
+        body = await super().body()
+        self.scope[BODY_SCOPE_KEY] = body
+        return body
+
+    async def json(self) -> Any:
+        return await get_cached_json(self)
+
+
+class CachedBodyRoute(APIRoute):
+    """
+    APIRoute that hands handlers a CachedBodyRequest.
+    Use with: APIRouter(route_class=CachedBodyRoute)
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def cached_body_handler(request: Request):
+            return await original_handler(CachedBodyRequest(request.scope, request.receive))
+
+        return cached_body_handler
@@ -7,6 +7,7 @@ from typing import Dict, Tuple, Set
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from middleware.body_cache import get_cached_body
 
 # Remember last (method, path, body-hash) per client briefly to avoid loops.
 WINDOW_SECONDS = 2.0
@@ -43,16 +44,17 @@ class LoopControlMiddleware(BaseHTTPMiddleware):
             if test_id or test_suite or "test" in user_agent.lower():
                 return await call_next(request)
 
-        # Read the body to create a proper signature for identical request detection
+        # Read the body to create a proper signature for identical request detection.
+        # The bytes are cached in the ASGI scope (and replayed downstream by
+        # BaseHTTPMiddleware), so later readers reuse them.
         body = b""
         if request.method in ("POST", "PUT", "PATCH"):
-            body = await request.body()
-            # Recreate request with the body for downstream processing
-            request = Request(request.scope, receive=self._make_receive(body))
+            body = await get_cached_body(request)
 
-        # Create signature including body content hash for exact duplicate detection
+        # Create signature including query string and body content hash for exact
+        # duplicate detection (cursor-paginated GETs differ only by query string)
         body_hash = hashlib.md5(body).hexdigest()
-        signature = f"{method}:{path}:{body_hash}"
+        signature = f"{method}:{path}?{request.url.query}:{body_hash}"
 
         now = time.time()
         key = (client_id, signature)
@@ -66,9 +68,3 @@ class LoopControlMiddleware(BaseHTTPMiddleware):
 
         self._seen[key] = now
         return await call_next(request)
-    
-    def _make_receive(self, body: bytes):
-        """Create a receive callable that returns the cached body."""
-        async def receive():
-            return {"type": "http.request", "body": body, "more_body": False}
-        return receive
\ No newline at end of file
@@ -0,0 +1,69 @@
+# tests/test_body_cache.py
+
+import json
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from middleware import body_cache
+from middleware.body_cache import CachedBodyRoute, get_cached_json
+from middleware.loop_control import LoopControlMiddleware
+from models.schemas import AgentInput
+
+
+class _JsonPeekMiddleware(BaseHTTPMiddleware):
+    """Stands in for any middleware that inspects the JSON body."""
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.peeked = None
+        if request.method == "POST":
+            try:
+                request.state.peeked = await get_cached_json(request)
+            except ValueError:
+                pass
+        return await call_next(request)
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    router = APIRouter(route_class=CachedBodyRoute)
+
+    @router.post("/echo")
+    async def echo(data: AgentInput, request: Request):
+        parsed = await request.json()
+        return {"name": data.name, "shared": parsed is request.state.peeked}
+
+    app.include_router(router)
+    app.add_middleware(_JsonPeekMiddleware)
+    app.add_middleware(LoopControlMiddleware)
+    return app
+
+
+def test_json_parsed_once_and_shared(monkeypatch):
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(data, *args, **kwargs):
+        calls.append(data)
+        return real_loads(data, *args, **kwargs)
+
+    monkeypatch.setattr(body_cache.json, "loads", counting_loads)
+    client = TestClient(_build_app())
+
+    response = client.post("/echo", json={"name": "Cache User", "query": "once"})
+    # Count before response.json(), which goes through json.loads too
+    server_side_parses = len(calls)
+    assert response.status_code == 200
+    assert response.json() == {"name": "Cache User", "shared": True}
+    assert server_side_parses == 1
+
+
+def test_invalid_json_still_returns_422():
+    client = TestClient(_build_app())
+    response = client.post(
+        "/echo",
+        content="this is not JSON",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
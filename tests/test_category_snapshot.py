@@ -0,0 +1,70 @@
+# tests/test_category_snapshot.py
+
+from fastapi.testclient import TestClient
+
+from core.app import create_app
+from logic import category_snapshot
+from logic.category_snapshot import CategorySnapshot
+
+ROWS = {
+    f"cat-{i:03d}": {
+        "name": f"Category {i}",
+        "category_type": "equipment" if i % 2 else "supplies",
+        "description": f"Description {i}",
+        "is_active": i % 5 != 0,
+    }
+    for i in range(1, 41)
+}
+
+
+def test_keyset_pages_cover_filtered_rows_exactly_once():
+    snapshot = CategorySnapshot(ROWS, source="database", version=1)
+    expected = [
+        cat_id for cat_id, row in sorted(ROWS.items())
+        if row["category_type"] == "equipment" and row["is_active"]
+    ]
+
+    seen, cursor = [], None
+    while True:
+        page = snapshot.page(limit=3, category_type="equipment", active_only=True, cursor=cursor)
+        seen.extend(row["id"] for row in page["categories"])
+        assert page["total"] == len(expected)
+        if not page["has_more"]:
+            break
+        cursor = page["next_cursor"]
+
+    assert seen == expected
+
+
+def test_offset_pagination_and_inactive_rows():
+    snapshot = CategorySnapshot(ROWS, source="database", version=1)
+    page = snapshot.page(limit=5, active_only=False, offset=35)
+    assert [row["id"] for row in page["categories"]] == [f"cat-{i:03d}" for i in range(36, 41)]
+    assert page["has_more"] is False
+    assert snapshot.count(active_only=True) == 32
+    assert snapshot.get("cat-007")["name"] == "Category 7"
+    assert snapshot.get("missing") is None
+
+
+def test_categories_endpoint_serves_published_snapshot():
+    category_snapshot.publish_snapshot(ROWS, "database")
+    try:
+        client = TestClient(create_app())
+        response = client.get(
+            "/api/database/categories",
+            params={"limit": 10, "category_type": "supplies"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "database"
+        assert data["pagination"]["total"] == 16
+        assert data["pagination"]["next_cursor"] == data["categories"][-1]["id"]
+
+        follow = client.get(
+            "/api/database/categories",
+            params={"limit": 10, "category_type": "supplies", "cursor": data["pagination"]["next_cursor"]},
+        )
+        assert len(follow.json()["categories"]) == 6
+        assert follow.json()["pagination"]["has_more"] is False
+    finally:
+        category_snapshot.invalidate_snapshot()